@@ -1,7 +1,25 @@
 """Shared fixtures and mocks for all tests"""
+import copy
+import sys
 import pytest
-from unittest.mock import Mock, MagicMock, patch
 from dataclasses import dataclass
+from types import SimpleNamespace
+from document_processor import DocumentProcessor
+from tests.fakes import FakeChromaClient, FakeCollection
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Suspend the sys.settrace hook (e.g. pytest-cov's tracer) while a no_trace test runs"""
+    if not item.get_closest_marker("no_trace"):
+        yield
+        return
+    tracer = sys.gettrace()
+    sys.settrace(None)
+    try:
+        yield
+    finally:
+        sys.settrace(tracer)
 
 
 @dataclass
@@ -17,14 +35,41 @@ class TestConfig:
     CHROMA_PATH: str = "./test_chroma_db"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_config():
-    """Create a test configuration"""
+    """Create a test configuration shared read-only across tests"""
     return TestConfig()
 
 
-@pytest.fixture
-def sample_course_document(tmp_path):
+@pytest.fixture(scope="session")
+def processor_factory():
+    """Return a factory of DocumentProcessors cached by chunk settings"""
+    cache = {}
+
+    def _get(chunk_size=800, chunk_overlap=100):
+        key = (chunk_size, chunk_overlap)
+        if key not in cache:
+            cache[key] = DocumentProcessor(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+        return cache[key]
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def make_course_doc(tmp_path_factory):
+    """Return a factory that writes a course document and returns its path"""
+    courses_dir = tmp_path_factory.mktemp("courses")
+
+    def _make(content, name="course.txt"):
+        doc_path = courses_dir / name
+        doc_path.write_text(content, encoding="utf-8")
+        return str(doc_path)
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def sample_course_document(make_course_doc):
     """Create a sample course document file for testing"""
     content = """Course Title: Test Course
 Course Link: https://example.com/course
@@ -38,13 +83,17 @@ Lesson 1: First Lesson
 Lesson Link: https://example.com/lesson1
 This is the first lesson content with more details. Students will learn about the basics here.
 """
-    doc_path = tmp_path / "test_course.txt"
-    doc_path.write_text(content)
-    return str(doc_path)
+    return make_course_doc(content, "test_course.txt")
 
 
-@pytest.fixture
-def sample_course_no_lessons(tmp_path):
+@pytest.fixture(scope="session")
+def processed_sample_course(sample_course_document, processor_factory):
+    """Parse the sample course document once and share the (course, chunks) result"""
+    return processor_factory().process_course_document(sample_course_document)
+
+
+@pytest.fixture(scope="session")
+def sample_course_no_lessons(make_course_doc):
     """Create a sample course document without lesson markers"""
     content = """Course Title: Simple Course
 Course Link: https://example.com/simple
@@ -53,79 +102,95 @@ Course Instructor: Simple Instructor
 This is just plain content without any lesson markers.
 It should be processed as a single document.
 """
-    doc_path = tmp_path / "simple_course.txt"
-    doc_path.write_text(content)
-    return str(doc_path)
+    return make_course_doc(content, "simple_course.txt")
+
+
+def _build_response(stop_reason, *blocks):
+    """Build an Anthropic API response payload from (attribute dict) content blocks"""
+    return SimpleNamespace(
+        stop_reason=stop_reason,
+        content=[SimpleNamespace(**attrs) for attrs in blocks]
+    )
+
+
+@pytest.fixture(scope="session")
+def _anthropic_response_template():
+    """Build the plain text Anthropic response once per session"""
+    return _build_response(
+        "end_turn",
+        {"type": "text", "text": "This is a test response from Claude."}
+    )
+
+
+@pytest.fixture(scope="session")
+def _anthropic_tool_response_template():
+    """Build the tool use Anthropic response once per session"""
+    return _build_response(
+        "tool_use",
+        {
+            "type": "tool_use",
+            "name": "search_course_content",
+            "id": "tool_123",
+            "input": {"query": "test query"}
+        }
+    )
 
 
 @pytest.fixture
-def mock_anthropic_response():
+def mock_anthropic_response(_anthropic_response_template):
     """Create a mock Anthropic API response"""
-    response = Mock()
-    response.stop_reason = "end_turn"
-    text_block = Mock()
-    text_block.type = "text"
-    text_block.text = "This is a test response from Claude."
-    response.content = [text_block]
-    return response
+    return copy.copy(_anthropic_response_template)
 
 
 @pytest.fixture
-def mock_anthropic_tool_response():
+def mock_anthropic_tool_response(_anthropic_tool_response_template):
     """Create a mock Anthropic API response with tool use"""
-    response = Mock()
-    response.stop_reason = "tool_use"
+    return copy.copy(_anthropic_tool_response_template)
 
-    tool_block = Mock()
-    tool_block.type = "tool_use"
-    tool_block.name = "search_course_content"
-    tool_block.id = "tool_123"
-    tool_block.input = {"query": "test query"}
 
-    response.content = [tool_block]
-    return response
+@pytest.fixture(scope="session")
+def _session_chroma_collection():
+    """Build the ChromaDB collection fake once per session"""
+    return FakeCollection()
 
 
-@pytest.fixture
-def mock_chroma_collection():
-    """Mock a ChromaDB collection"""
-    collection = Mock()
-    collection.query.return_value = {
-        'documents': [['Test content from course']],
-        'metadatas': [[{'course_title': 'Test Course', 'lesson_number': 1}]],
-        'distances': [[0.5]]
-    }
-    collection.get.return_value = {
-        'ids': ['Test Course'],
-        'metadatas': [{'title': 'Test Course', 'instructor': 'Test Instructor', 'course_link': 'https://example.com', 'lessons_json': '[]', 'lesson_count': 0}]
-    }
-    collection.add.return_value = None
-    collection.count.return_value = 1
-    return collection
+@pytest.fixture(scope="session")
+def _session_chroma_client(_session_chroma_collection):
+    """Build the ChromaDB PersistentClient fake once per session"""
+    return FakeChromaClient(_session_chroma_collection)
 
 
 @pytest.fixture
-def mock_chroma_client(mock_chroma_collection):
-    """Mock the ChromaDB PersistentClient"""
-    client = Mock()
-    client.get_or_create_collection.return_value = mock_chroma_collection
-    client.delete_collection.return_value = None
-    return client
+def mock_chroma_collection(_session_chroma_collection):
+    """Shared ChromaDB collection fake reset to its defaults"""
+    # Tests override query/get payloads, so restore the defaults as well as the call history
+    _session_chroma_collection.reset()
+    return _session_chroma_collection
 
 
 @pytest.fixture
+def mock_chroma_client(_session_chroma_client, mock_chroma_collection):
+    """Shared ChromaDB PersistentClient fake with call history reset"""
+    _session_chroma_client.reset()
+    return _session_chroma_client
+
+
+@pytest.fixture(scope="session")
 def mock_search_results():
-    """Create mock search results"""
+    """Create mock search results shared read-only across tests (tuples guard against mutation)"""
+    # Imported here so loading conftest doesn't pull in chromadb for every test run
     from vector_store import SearchResults
+
     return SearchResults(
-        documents=["Test content about Python programming"],
-        metadata=[{"course_title": "Test Course", "lesson_number": 1}],
-        distances=[0.25]
+        documents=("Test content about Python programming",),
+        metadata=({"course_title": "Test Course", "lesson_number": 1},),
+        distances=(0.25,)
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_empty_search_results():
-    """Create empty mock search results"""
+    """Create empty mock search results shared read-only across tests"""
     from vector_store import SearchResults
+
     return SearchResults.empty("No results found")
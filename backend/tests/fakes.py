@@ -0,0 +1,90 @@
+"""Lightweight call-recording fakes shared by the tests"""
+from unittest.mock import call
+
+
+class Recorder:
+    """Callable stand-in for a Mock method that records calls and honours return_value/side_effect"""
+
+    # Slots make assigning an unsupported Mock attribute raise instead of being silently ignored
+    __slots__ = ("return_value", "_side_effect", "call_args_list")
+
+    def __init__(self, return_value=None, side_effect=None):
+        self.return_value = return_value
+        self.side_effect = side_effect
+        self.call_args_list = []
+
+    @property
+    def side_effect(self):
+        return self._side_effect
+
+    @side_effect.setter
+    def side_effect(self, value):
+        # Like Mock, iterables yield one result per call
+        if value is not None and not callable(value) and not isinstance(value, BaseException):
+            value = iter(value)
+        self._side_effect = value
+
+    def __call__(self, *args, **kwargs):
+        self.call_args_list.append(call(*args, **kwargs))
+        effect = self._side_effect
+        if effect is None:
+            return self.return_value
+        if isinstance(effect, BaseException) or (isinstance(effect, type) and issubclass(effect, BaseException)):
+            raise effect
+        if callable(effect):
+            return effect(*args, **kwargs)
+        result = next(effect)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    @property
+    def call_count(self):
+        return len(self.call_args_list)
+
+    @property
+    def call_args(self):
+        return self.call_args_list[-1] if self.call_args_list else None
+
+    def assert_called(self):
+        assert self.call_args_list, "Expected to be called"
+
+    def assert_called_once(self):
+        assert self.call_count == 1, f"Expected to be called once. Called {self.call_count} times."
+
+    def assert_not_called(self):
+        assert not self.call_args_list, f"Expected not to be called. Called {self.call_count} times."
+
+
+class FakeCollection:
+    """ChromaDB collection fake exposing only the methods VectorStore uses"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Restore the default query/get payloads and drop recorded calls"""
+        self.query = Recorder({
+            'documents': [['Test content from course']],
+            'metadatas': [[{'course_title': 'Test Course', 'lesson_number': 1}]],
+            'distances': [[0.5]]
+        })
+        self.get = Recorder({
+            'ids': ['Test Course'],
+            'metadatas': [{'title': 'Test Course', 'instructor': 'Test Instructor', 'course_link': 'https://example.com', 'lessons_json': '[]', 'lesson_count': 0}]
+        })
+        self.add = Recorder(None)
+        self.count = Recorder(1)
+
+
+class FakeChromaClient:
+    """ChromaDB PersistentClient fake handing out a single shared collection"""
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.reset()
+
+    def reset(self):
+        """Drop recorded calls"""
+        self.get_or_create_collection = Recorder(self.collection)
+        self.delete_collection = Recorder(None)
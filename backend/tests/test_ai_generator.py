@@ -1,22 +1,36 @@
 """Tests for AIGenerator module"""
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+from ai_generator import AIGenerator
+from tests.fakes import Recorder
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_anthropic():
+    """Patch the Anthropic client class once for the whole module"""
+    with patch('ai_generator.anthropic.Anthropic') as MockClient:
+        yield MockClient
+
+
+@pytest.fixture(autouse=True)
+def mock_anthropic_class(_patch_anthropic):
+    """Give each test a fresh client and clean call history"""
+    _patch_anthropic.reset_mock(return_value=True, side_effect=True)
+    return _patch_anthropic
 
 
 class TestAIGeneratorInitialization:
     """Tests for AIGenerator initialization"""
 
-    def test_initialization(self):
+    def test_initialization(self, mock_anthropic_class):
         """Test AIGenerator initializes with correct parameters"""
-        with patch('ai_generator.anthropic.Anthropic') as MockClient:
-            from ai_generator import AIGenerator
+        generator = AIGenerator("test-api-key", "claude-sonnet-4-20250514")
 
-            generator = AIGenerator("test-api-key", "claude-sonnet-4-20250514")
-
-            MockClient.assert_called_once_with(api_key="test-api-key")
-            assert generator.model == "claude-sonnet-4-20250514"
-            assert generator.base_params["temperature"] == 0
-            assert generator.base_params["max_tokens"] == 800
+        mock_anthropic_class.assert_called_once_with(api_key="test-api-key")
+        assert generator.model == "claude-sonnet-4-20250514"
+        assert generator.base_params["temperature"] == 0
+        assert generator.base_params["max_tokens"] == 800
 
 
 class TestGenerateResponse:
@@ -25,20 +39,19 @@ class TestGenerateResponse:
     @pytest.fixture
     def mock_generator(self, mock_anthropic_response):
         """Create AIGenerator with mocked client"""
-        with patch('ai_generator.anthropic.Anthropic') as MockClient:
-            from ai_generator import AIGenerator
+        generator = AIGenerator("test-api-key", "claude-sonnet-4-20250514")
 
-            generator = AIGenerator("test-api-key", "claude-sonnet-4-20250514")
-            generator.client.messages.create.return_value = mock_anthropic_response
+        # Record create() calls with a plain stub instead of Mock bookkeeping
+        generator.client.messages.create = Recorder(mock_anthropic_response)
 
-            return generator
+        return generator
 
     def test_generate_simple_response(self, mock_generator):
         """Test generating a simple response without tools"""
         response = mock_generator.generate_response("What is Python?")
 
         assert response == "This is a test response from Claude."
-        mock_generator.client.messages.create.assert_called_once()
+        assert mock_generator.client.messages.create.call_count == 1
 
     def test_generate_response_with_history(self, mock_generator):
         """Test generating response with conversation history"""
@@ -46,16 +59,16 @@ class TestGenerateResponse:
 
         mock_generator.generate_response("Follow up question", conversation_history=history)
 
-        call_args = mock_generator.client.messages.create.call_args
-        assert history in call_args.kwargs["system"]
+        last_kwargs = mock_generator.client.messages.create.call_args.kwargs
+        assert history in last_kwargs["system"]
 
     def test_generate_response_without_history(self, mock_generator):
         """Test that system prompt is used without history"""
         mock_generator.generate_response("Simple question")
 
-        call_args = mock_generator.client.messages.create.call_args
-        assert "AI assistant" in call_args.kwargs["system"]
-        assert "Previous conversation" not in call_args.kwargs["system"]
+        last_kwargs = mock_generator.client.messages.create.call_args.kwargs
+        assert "AI assistant" in last_kwargs["system"]
+        assert "Previous conversation" not in last_kwargs["system"]
 
     def test_generate_response_with_tools(self, mock_generator):
         """Test that tools are passed to API call"""
@@ -63,9 +76,9 @@ class TestGenerateResponse:
 
         mock_generator.generate_response("Question", tools=tools)
 
-        call_args = mock_generator.client.messages.create.call_args
-        assert call_args.kwargs["tools"] == tools
-        assert call_args.kwargs["tool_choice"] == {"type": "auto"}
+        last_kwargs = mock_generator.client.messages.create.call_args.kwargs
+        assert last_kwargs["tools"] == tools
+        assert last_kwargs["tool_choice"] == {"type": "auto"}
 
 
 class TestToolExecution:
@@ -74,17 +87,15 @@ class TestToolExecution:
     @pytest.fixture
     def mock_generator_with_tools(self, mock_anthropic_tool_response, mock_anthropic_response):
         """Create AIGenerator configured for tool use"""
-        with patch('ai_generator.anthropic.Anthropic') as MockClient:
-            from ai_generator import AIGenerator
-
-            generator = AIGenerator("test-api-key", "claude-sonnet-4-20250514")
-            # First call returns tool use, second call returns final response
-            generator.client.messages.create.side_effect = [
-                mock_anthropic_tool_response,
-                mock_anthropic_response
-            ]
+        generator = AIGenerator("test-api-key", "claude-sonnet-4-20250514")
+        # First call returns tool use, second call returns final response.
+        # create stays a Mock so test_tool_results_sent_back can read call_args_list
+        generator.client.messages.create.side_effect = iter((
+            mock_anthropic_tool_response,
+            mock_anthropic_response
+        ))
 
-            return generator
+        return generator
 
     def test_handle_tool_execution(self, mock_generator_with_tools):
         """Test that tool execution flow works correctly"""
@@ -126,22 +137,17 @@ class TestToolExecution:
 
     def test_no_tool_execution_without_manager(self):
         """Test that tool use response returns text content when no manager provided"""
-        with patch('ai_generator.anthropic.Anthropic') as MockClient:
-            from ai_generator import AIGenerator
+        generator = AIGenerator("test-api-key", "claude-sonnet-4-20250514")
 
-            generator = AIGenerator("test-api-key", "claude-sonnet-4-20250514")
-
-            # Create response with tool_use - when no tool_manager is provided,
-            # the code falls through to return response.content[0].text
-            response = Mock()
-            response.stop_reason = "tool_use"
-            tool_block = Mock()
-            tool_block.type = "tool_use"
-            tool_block.text = "Tool response text"
-            response.content = [tool_block]
+        # Create response with tool_use - when no tool_manager is provided,
+        # the code falls through to return response.content[0].text
+        response = SimpleNamespace(
+            stop_reason="tool_use",
+            content=[SimpleNamespace(type="tool_use", text="Tool response text")]
+        )
 
-            generator.client.messages.create.return_value = response
+        generator.client.messages.create.return_value = response
 
-            # Without tool_manager, returns the text from first content block
-            result = generator.generate_response("Query", tools=[{"name": "test"}])
-            assert result == "Tool response text"
+        # Without tool_manager, returns the text from first content block
+        result = generator.generate_response("Query", tools=[{"name": "test"}])
+        assert result == "Tool response text"
@@ -1,82 +1,80 @@
 """Tests for FastAPI endpoints"""
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 from fastapi.testclient import TestClient
 
 
+@pytest.fixture(scope="session")
+def _session_rag_system():
+    """Create the RAGSystem mock shared by the session-wide test client"""
+    # add_course_folder is called by the app's startup event
+    rag = Mock(spec=["query", "get_course_analytics", "session_manager", "add_course_folder"])
+    rag.add_course_folder.return_value = (0, 0)
+    rag.session_manager = Mock()
+    return rag
+
+
+@pytest.fixture(scope="session")
+def _app_client(_session_rag_system):
+    """Start the FastAPI app once per session with a mocked RAGSystem"""
+    with patch('app.RAGSystem', return_value=_session_rag_system), \
+         patch('app.rag_system', _session_rag_system):
+        from app import app
+        with TestClient(app, raise_server_exceptions=False) as test_client:
+            yield test_client
+
+
 @pytest.fixture
-def mock_rag_system():
-    """Create a mock RAGSystem"""
-    rag = Mock()
+def mock_rag_system(_session_rag_system):
+    """Reset the shared RAGSystem mock to its default responses"""
+    rag = _session_rag_system
+    rag.reset_mock(return_value=True, side_effect=True)
     rag.query.return_value = ("Test answer", ["Test Course - Lesson 1"])
     rag.get_course_analytics.return_value = {
         "total_courses": 2,
         "course_titles": ["Test Course", "Another Course"]
     }
-    rag.session_manager = Mock()
     rag.session_manager.create_session.return_value = "session_1"
     return rag
 
 
 @pytest.fixture
-def client(mock_rag_system):
+def client(_app_client, mock_rag_system):
     """Create test client with mocked RAGSystem"""
-    with patch('app.RAGSystem') as MockRAG:
-        MockRAG.return_value = mock_rag_system
-        with patch('app.rag_system', mock_rag_system):
-            from app import app
-            with TestClient(app, raise_server_exceptions=False) as test_client:
-                yield test_client
+    return _app_client
 
 
 class TestQueryEndpoint:
     """Tests for POST /api/query endpoint"""
 
-    def test_query_success(self, client, mock_rag_system):
-        """Test successful query returns expected response structure"""
-        response = client.post(
-            "/api/query",
-            json={"query": "What is this course about?"}
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert "answer" in data
-        assert "sources" in data
-        assert "session_id" in data
-        assert isinstance(data["sources"], list)
-
-    def test_query_creates_session_when_not_provided(self, client, mock_rag_system):
-        """Test that a new session is created when session_id is not provided"""
-        response = client.post(
-            "/api/query",
-            json={"query": "Test query"}
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["session_id"] == "session_1"
-        mock_rag_system.session_manager.create_session.assert_called_once()
-
-    def test_query_uses_existing_session(self, client, mock_rag_system):
-        """Test that existing session_id is used when provided"""
-        response = client.post(
-            "/api/query",
-            json={"query": "Test query", "session_id": "existing_session"}
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["session_id"] == "existing_session"
-        mock_rag_system.session_manager.create_session.assert_not_called()
-
-    def test_query_returns_answer_and_sources(self, client, mock_rag_system):
-        """Test that query returns both answer and sources"""
-        response = client.post(
-            "/api/query",
-            json={"query": "What is Python?"}
-        )
+    @pytest.mark.parametrize("payload,expected", [
+        pytest.param(
+            {"query": "Test query"},
+            {"session_id": "session_1"},
+            id="creates_session_when_not_provided"
+        ),
+        pytest.param(
+            {"query": "Test query", "session_id": "existing_session"},
+            {"session_id": "existing_session"},
+            id="uses_existing_session"
+        ),
+        pytest.param(
+            {"query": "What is Python?"},
+            {"answer": "Test answer", "sources": ["Test Course - Lesson 1"]},
+            id="returns_answer_and_sources"
+        ),
+    ])
+    def test_query_variants(self, client, mock_rag_system, payload, expected):
+        """Test successful queries return the expected response fields"""
+        response = client.post("/api/query", json=payload)
         assert response.status_code == 200
         data = response.json()
-        assert data["answer"] == "Test answer"
-        assert data["sources"] == ["Test Course - Lesson 1"]
+        assert set(data) == {"answer", "sources", "session_id"}
+        for key, value in expected.items():
+            assert data[key] == value
+        # A session is only created when the request doesn't carry one
+        expected_sessions = 0 if "session_id" in payload else 1
+        assert mock_rag_system.session_manager.create_session.call_count == expected_sessions
 
     def test_query_handles_rag_error(self, client, mock_rag_system):
         """Test that RAG system errors return 500"""
@@ -1,143 +1,126 @@
 """Tests for DocumentProcessor module"""
 import pytest
-from document_processor import DocumentProcessor
+
+# Keep these tests on one xdist worker so their session fixtures are built once
+pytestmark = pytest.mark.xdist_group(name="docproc")
 
 
 class TestReadFile:
     """Tests for DocumentProcessor.read_file method"""
 
-    def test_read_utf8_file(self, tmp_path):
+    def test_read_utf8_file(self, processor_factory, make_course_doc):
         """Test reading UTF-8 encoded file"""
-        processor = DocumentProcessor(chunk_size=800, chunk_overlap=100)
+        processor = processor_factory()
 
-        file_path = tmp_path / "test.txt"
-        file_path.write_text("Hello, World!", encoding="utf-8")
+        file_path = make_course_doc("Hello, World!", "utf8.txt")
 
-        content = processor.read_file(str(file_path))
+        content = processor.read_file(file_path)
         assert content == "Hello, World!"
 
-    def test_read_file_with_special_characters(self, tmp_path):
+    def test_read_file_with_special_characters(self, processor_factory, make_course_doc):
         """Test reading file with special characters"""
-        processor = DocumentProcessor(chunk_size=800, chunk_overlap=100)
+        processor = processor_factory()
 
-        file_path = tmp_path / "test.txt"
-        file_path.write_text("Héllo Wörld! 你好", encoding="utf-8")
+        file_path = make_course_doc("Héllo Wörld! 你好", "special_chars.txt")
 
-        content = processor.read_file(str(file_path))
+        content = processor.read_file(file_path)
         assert "Héllo" in content
         assert "你好" in content
 
 
-class TestChunkText:
-    """Tests for DocumentProcessor.chunk_text method"""
-
-    def test_chunk_text_basic(self):
-        """Test basic text chunking"""
-        processor = DocumentProcessor(chunk_size=100, chunk_overlap=20)
-
-        text = "This is sentence one. This is sentence two. This is sentence three."
-        chunks = processor.chunk_text(text)
-
-        assert len(chunks) >= 1
-        assert all(len(chunk) <= 100 or chunk == chunks[-1] for chunk in chunks)
-
-    def test_chunk_text_preserves_sentences(self):
-        """Test that chunking doesn't break mid-sentence when possible"""
-        processor = DocumentProcessor(chunk_size=50, chunk_overlap=10)
-
-        text = "Short sentence. Another short one. And one more."
-        chunks = processor.chunk_text(text)
-
+# (chunk_size, chunk_overlap, text, check) cases for DocumentProcessor.chunk_text
+CHUNK_CASES = [
+    pytest.param(
+        100, 20,
+        "This is sentence one. This is sentence two. This is sentence three.",
+        lambda c: len(c) >= 1 and all(len(chunk) <= 100 or chunk == c[-1] for chunk in c),
+        id="basic"
+    ),
+    pytest.param(
+        50, 10,
+        "Short sentence. Another short one. And one more.",
         # Each chunk should end with a complete sentence (period)
-        for chunk in chunks:
-            assert chunk.strip().endswith('.') or chunk == chunks[-1]
-
-    def test_chunk_text_empty_input(self):
-        """Test chunking empty string"""
-        processor = DocumentProcessor(chunk_size=800, chunk_overlap=100)
-
-        chunks = processor.chunk_text("")
-        assert chunks == []
+        lambda c: all(chunk.strip().endswith('.') or chunk == c[-1] for chunk in c),
+        id="preserves_sentences"
+    ),
+    pytest.param(
+        800, 100,
+        "",
+        lambda c: c == [],
+        id="empty_input"
+    ),
+    pytest.param(
+        800, 100,
+        "This is a short text.",
+        lambda c: len(c) == 1 and c[0] == "This is a short text.",
+        id="short_input"
+    ),
+    pytest.param(
+        100, 30,
+        "First sentence here. Second sentence here. Third sentence here. Fourth sentence here.",
+        # Overlap behavior depends on sentence boundaries, so only check chunks are produced
+        lambda c: len(c) >= 1,
+        id="overlap"
+    ),
+    pytest.param(
+        800, 100,
+        "Multiple   spaces   and\n\nnewlines.",
+        lambda c: "  " not in c[0],  # No double spaces
+        id="whitespace_normalization"
+    ),
+]
 
-    def test_chunk_text_short_input(self):
-        """Test chunking text shorter than chunk size"""
-        processor = DocumentProcessor(chunk_size=800, chunk_overlap=100)
 
-        text = "This is a short text."
-        chunks = processor.chunk_text(text)
-
-        assert len(chunks) == 1
-        assert chunks[0] == text
-
-    def test_chunk_text_overlap(self):
-        """Test that chunks have overlap"""
-        processor = DocumentProcessor(chunk_size=100, chunk_overlap=30)
-
-        text = "First sentence here. Second sentence here. Third sentence here. Fourth sentence here."
-        chunks = processor.chunk_text(text)
-
-        if len(chunks) > 1:
-            # Check if there's some overlap (content from end of chunk n appears in chunk n+1)
-            # This is a basic check - overlap behavior depends on sentence boundaries
-            assert len(chunks) >= 1
-
-    def test_chunk_text_whitespace_normalization(self):
-        """Test that whitespace is normalized"""
-        processor = DocumentProcessor(chunk_size=800, chunk_overlap=100)
+class TestChunkText:
+    """Tests for DocumentProcessor.chunk_text method"""
 
-        text = "Multiple   spaces   and\n\nnewlines."
-        chunks = processor.chunk_text(text)
+    @pytest.mark.parametrize("chunk_size,chunk_overlap,text,check", CHUNK_CASES)
+    def test_chunk_text_cases(self, processor_factory, chunk_size, chunk_overlap, text, check):
+        """Test chunking across input shapes and chunk settings"""
+        chunks = processor_factory(chunk_size, chunk_overlap).chunk_text(text)
 
-        assert "  " not in chunks[0]  # No double spaces
+        assert check(chunks)
 
 
 class TestProcessCourseDocument:
     """Tests for DocumentProcessor.process_course_document method"""
 
-    def test_process_course_document_extracts_metadata(self, sample_course_document):
+    def test_process_course_document_extracts_metadata(self, processed_sample_course):
         """Test that course metadata is extracted correctly"""
-        processor = DocumentProcessor(chunk_size=800, chunk_overlap=100)
-
-        course, chunks = processor.process_course_document(sample_course_document)
+        course, chunks = processed_sample_course
 
         assert course.title == "Test Course"
         assert course.course_link == "https://example.com/course"
         assert course.instructor == "Test Instructor"
 
-    def test_process_course_document_extracts_lessons(self, sample_course_document):
+    def test_process_course_document_extracts_lessons(self, processed_sample_course):
         """Test that lessons are extracted correctly"""
-        processor = DocumentProcessor(chunk_size=800, chunk_overlap=100)
-
-        course, chunks = processor.process_course_document(sample_course_document)
+        course, chunks = processed_sample_course
 
         assert len(course.lessons) == 2
         assert course.lessons[0].lesson_number == 0
         assert course.lessons[0].title == "Introduction"
         assert course.lessons[1].lesson_number == 1
 
-    def test_process_course_document_creates_chunks(self, sample_course_document):
+    def test_process_course_document_creates_chunks(self, processed_sample_course):
         """Test that content chunks are created"""
-        processor = DocumentProcessor(chunk_size=800, chunk_overlap=100)
-
-        course, chunks = processor.process_course_document(sample_course_document)
+        course, chunks = processed_sample_course
 
         assert len(chunks) > 0
         for chunk in chunks:
             assert chunk.course_title == "Test Course"
             assert chunk.chunk_index >= 0
 
-    def test_process_course_document_lesson_links(self, sample_course_document):
+    def test_process_course_document_lesson_links(self, processed_sample_course):
         """Test that lesson links are extracted"""
-        processor = DocumentProcessor(chunk_size=800, chunk_overlap=100)
-
-        course, chunks = processor.process_course_document(sample_course_document)
+        course, chunks = processed_sample_course
 
         assert course.lessons[0].lesson_link == "https://example.com/lesson0"
         assert course.lessons[1].lesson_link == "https://example.com/lesson1"
 
-    def test_process_course_document_no_lessons(self, sample_course_no_lessons):
+    def test_process_course_document_no_lessons(self, processor_factory, sample_course_no_lessons):
         """Test processing document without lesson markers"""
-        processor = DocumentProcessor(chunk_size=800, chunk_overlap=100)
+        processor = processor_factory()
 
         course, chunks = processor.process_course_document(sample_course_no_lessons)
 
@@ -146,29 +129,26 @@ class TestProcessCourseDocument:
         # Should still create chunks from the content
         assert len(chunks) > 0
 
-    def test_process_course_document_missing_metadata(self, tmp_path):
+    def test_process_course_document_missing_metadata(self, processor_factory, make_course_doc):
         """Test handling of document with missing metadata fields"""
-        processor = DocumentProcessor(chunk_size=800, chunk_overlap=100)
+        processor = processor_factory()
 
         # Create document with minimal metadata
         content = """Course Title: Minimal Course
 
 Some content here without proper structure.
 """
-        doc_path = tmp_path / "minimal.txt"
-        doc_path.write_text(content)
+        doc_path = make_course_doc(content, "minimal.txt")
 
-        course, chunks = processor.process_course_document(str(doc_path))
+        course, chunks = processor.process_course_document(doc_path)
 
         assert course.title == "Minimal Course"
         assert course.instructor is None
         assert course.course_link is None
 
-    def test_process_course_document_chunk_context(self, sample_course_document):
+    def test_process_course_document_chunk_context(self, processed_sample_course):
         """Test that chunks include lesson context"""
-        processor = DocumentProcessor(chunk_size=800, chunk_overlap=100)
-
-        course, chunks = processor.process_course_document(sample_course_document)
+        course, chunks = processed_sample_course
 
         # First chunks should have lesson context
         lesson_chunks = [c for c in chunks if c.lesson_number is not None]
@@ -1,53 +1,112 @@
 """Tests for RAGSystem orchestrator"""
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-import os
-
-
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import patch
+import rag_system as rs
+from rag_system import RAGSystem
+from models import Course, CourseChunk
+from tests.fakes import Recorder
+
+pytestmark = pytest.mark.xdist_group(name="rag_system_tests")
+
+# Component classes RAGSystem instantiates in __init__
+RAG_DEPENDENCIES = (
+    'DocumentProcessor',
+    'VectorStore',
+    'AIGenerator',
+    'SessionManager',
+    'ToolManager',
+    'CourseSearchTool',
+)
+
+# Parsed document results returned by the mocked DocumentProcessor
+_TEST_COURSE = Course(title="Test Course", course_link="https://example.com")
+_TEST_CHUNKS = (
+    CourseChunk(content="Chunk 1", course_title="Test Course", chunk_index=0),
+    CourseChunk(content="Chunk 2", course_title="Test Course", chunk_index=1),
+)
+_FOLDER_COURSE = Course(title="Test Course")
+_FOLDER_CHUNKS = (CourseChunk(content="Chunk 1", course_title="Test Course", chunk_index=0),)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_rag_deps():
+    """Patch RAGSystem's component classes once for the whole module"""
+    with ExitStack() as stack:
+        yield SimpleNamespace(**{
+            name: stack.enter_context(patch.object(rs, name))
+            for name in RAG_DEPENDENCIES
+        })
+
+
+def _reset_rag_deps(ns):
+    """Reset the patched classes so the next RAGSystem gets fresh component mocks"""
+    for mock_class in vars(ns).values():
+        mock_class.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(autouse=True)
+def rag_deps(request, _patch_rag_deps):
+    """Give each test fresh component mocks"""
+    if request.node.get_closest_marker("no_shared_patches"):
+        return None
+    _reset_rag_deps(_patch_rag_deps)
+    return _patch_rag_deps
+
+
+@pytest.fixture(scope="module")
+def component_args(test_config):
+    """Constructor arguments RAGSystem should pass to each component"""
+    return SimpleNamespace(
+        DocumentProcessor=(test_config.CHUNK_SIZE, test_config.CHUNK_OVERLAP),
+        VectorStore=(test_config.CHROMA_PATH, test_config.EMBEDDING_MODEL, test_config.MAX_RESULTS),
+        AIGenerator=(test_config.ANTHROPIC_API_KEY, test_config.ANTHROPIC_MODEL),
+        SessionManager=(test_config.MAX_HISTORY,),
+    )
+
+
+@pytest.fixture
+def make_rag(rag_deps, test_config):
+    """Return a factory building a RAGSystem with default mock responses"""
+    def _build(**overrides):
+        rag = RAGSystem(test_config)
+        # A plain Recorder keeps Mock bookkeeping off the query hot path
+        rag.ai_generator.generate_response = Recorder(overrides.get('response', "Test response"))
+        rag.session_manager.get_conversation_history.return_value = overrides.get('history', None)
+        rag.tool_manager.get_tool_definitions.return_value = overrides.get('tools', [])
+        rag.tool_manager.get_last_sources.return_value = overrides.get('sources', ["Source 1"])
+        return rag
+
+    return _build
+
+
+@pytest.mark.no_shared_patches
 class TestRAGSystemInitialization:
     """Tests for RAGSystem initialization"""
 
-    def test_initialization_creates_components(self, test_config):
+    def test_initialization_creates_components(self, test_config, component_args):
         """Test that RAGSystem initializes all components"""
-        with patch('rag_system.DocumentProcessor') as MockDP, \
-             patch('rag_system.VectorStore') as MockVS, \
-             patch('rag_system.AIGenerator') as MockAI, \
-             patch('rag_system.SessionManager') as MockSM, \
-             patch('rag_system.ToolManager') as MockTM, \
-             patch('rag_system.CourseSearchTool') as MockCST:
-
-            from rag_system import RAGSystem
+        with ExitStack() as stack:
+            rag_deps = SimpleNamespace(**{
+                name: stack.enter_context(patch.object(rs, name))
+                for name in RAG_DEPENDENCIES
+            })
             rag = RAGSystem(test_config)
 
-            MockDP.assert_called_once_with(test_config.CHUNK_SIZE, test_config.CHUNK_OVERLAP)
-            MockVS.assert_called_once_with(test_config.CHROMA_PATH, test_config.EMBEDDING_MODEL, test_config.MAX_RESULTS)
-            MockAI.assert_called_once_with(test_config.ANTHROPIC_API_KEY, test_config.ANTHROPIC_MODEL)
-            MockSM.assert_called_once_with(test_config.MAX_HISTORY)
+        rag_deps.DocumentProcessor.assert_called_once_with(*component_args.DocumentProcessor)
+        rag_deps.VectorStore.assert_called_once_with(*component_args.VectorStore)
+        rag_deps.AIGenerator.assert_called_once_with(*component_args.AIGenerator)
+        rag_deps.SessionManager.assert_called_once_with(*component_args.SessionManager)
 
 
 class TestRAGSystemQuery:
     """Tests for RAGSystem.query method"""
 
     @pytest.fixture
-    def mock_rag_system(self, test_config):
+    def mock_rag_system(self, make_rag):
         """Create RAGSystem with mocked dependencies"""
-        with patch('rag_system.DocumentProcessor'), \
-             patch('rag_system.VectorStore'), \
-             patch('rag_system.AIGenerator') as MockAI, \
-             patch('rag_system.SessionManager') as MockSM, \
-             patch('rag_system.ToolManager') as MockTM, \
-             patch('rag_system.CourseSearchTool'):
-
-            from rag_system import RAGSystem
-            rag = RAGSystem(test_config)
-
-            # Configure mocks
-            rag.ai_generator.generate_response.return_value = "Test response"
-            rag.session_manager.get_conversation_history.return_value = None
-            rag.tool_manager.get_tool_definitions.return_value = []
-            rag.tool_manager.get_last_sources.return_value = ["Source 1"]
-
-            return rag
+        return make_rag()
 
     def test_query_without_session(self, mock_rag_system):
         """Test query works without session"""
@@ -55,59 +114,45 @@ class TestRAGSystemQuery:
 
         assert response == "Test response"
         assert sources == ["Source 1"]
-        mock_rag_system.ai_generator.generate_response.assert_called_once()
+        assert mock_rag_system.ai_generator.generate_response.call_count == 1
 
-    def test_query_with_session(self, mock_rag_system):
+    def test_query_with_session(self, make_rag):
         """Test query uses session history when provided"""
-        mock_rag_system.session_manager.get_conversation_history.return_value = "Previous: Context"
+        rag = make_rag(history="Previous: Context")
 
-        response, sources = mock_rag_system.query("Test question", "session_1")
+        response, sources = rag.query("Test question", "session_1")
 
-        mock_rag_system.session_manager.get_conversation_history.assert_called_with("session_1")
-        mock_rag_system.session_manager.add_exchange.assert_called_once()
+        rag.session_manager.get_conversation_history.assert_called_with("session_1")
+        rag.session_manager.add_exchange.assert_called_once()
+        assert rag.ai_generator.generate_response.call_args.kwargs["conversation_history"] == "Previous: Context"
 
     def test_query_resets_sources(self, mock_rag_system):
         """Test that query resets sources after retrieval"""
         mock_rag_system.query("Test question")
         mock_rag_system.tool_manager.reset_sources.assert_called_once()
 
-    def test_query_passes_tools_to_ai_generator(self, mock_rag_system):
+    def test_query_passes_tools_to_ai_generator(self, make_rag):
         """Test that query passes tools to AI generator"""
-        mock_rag_system.tool_manager.get_tool_definitions.return_value = [{"name": "test_tool"}]
+        rag = make_rag(tools=[{"name": "test_tool"}])
 
-        mock_rag_system.query("Test question")
+        rag.query("Test question")
 
-        call_args = mock_rag_system.ai_generator.generate_response.call_args
-        assert call_args.kwargs["tools"] == [{"name": "test_tool"}]
+        kwargs = rag.ai_generator.generate_response.call_args.kwargs
+        assert kwargs["tools"] == [{"name": "test_tool"}]
 
 
 class TestRAGSystemAddCourseDocument:
     """Tests for RAGSystem.add_course_document method"""
 
     @pytest.fixture
-    def mock_rag_for_docs(self, test_config):
+    def mock_rag_for_docs(self, make_rag):
         """Create RAGSystem with mocked dependencies for document tests"""
-        with patch('rag_system.DocumentProcessor') as MockDP, \
-             patch('rag_system.VectorStore') as MockVS, \
-             patch('rag_system.AIGenerator'), \
-             patch('rag_system.SessionManager'), \
-             patch('rag_system.ToolManager'), \
-             patch('rag_system.CourseSearchTool'):
-
-            from rag_system import RAGSystem
-            from models import Course, CourseChunk
+        rag = make_rag()
 
-            rag = RAGSystem(test_config)
+        # Configure document processor mock
+        rag.document_processor.process_course_document.return_value = (_TEST_COURSE, list(_TEST_CHUNKS))
 
-            # Configure document processor mock
-            mock_course = Course(title="Test Course", course_link="https://example.com")
-            mock_chunks = [
-                CourseChunk(content="Chunk 1", course_title="Test Course", chunk_index=0),
-                CourseChunk(content="Chunk 2", course_title="Test Course", chunk_index=1)
-            ]
-            rag.document_processor.process_course_document.return_value = (mock_course, mock_chunks)
-
-            return rag
+        return rag
 
     def test_add_course_document_success(self, mock_rag_for_docs):
         """Test successful document addition"""
@@ -132,46 +177,38 @@ class TestRAGSystemAddCourseFolder:
     """Tests for RAGSystem.add_course_folder method"""
 
     @pytest.fixture
-    def mock_rag_for_folder(self, test_config, tmp_path):
+    def mock_rag_for_folder(self, make_rag):
         """Create RAGSystem with mocked dependencies for folder tests"""
-        with patch('rag_system.DocumentProcessor') as MockDP, \
-             patch('rag_system.VectorStore') as MockVS, \
-             patch('rag_system.AIGenerator'), \
-             patch('rag_system.SessionManager'), \
-             patch('rag_system.ToolManager'), \
-             patch('rag_system.CourseSearchTool'):
+        rag = make_rag()
 
-            from rag_system import RAGSystem
-            from models import Course, CourseChunk
+        # Configure vector store mock
+        rag.vector_store.get_existing_course_titles.return_value = []
 
-            rag = RAGSystem(test_config)
+        # Configure document processor mock
+        rag.document_processor.process_course_document.return_value = (_FOLDER_COURSE, list(_FOLDER_CHUNKS))
 
-            # Configure vector store mock
-            rag.vector_store.get_existing_course_titles.return_value = []
+        return rag
 
-            # Configure document processor mock
-            mock_course = Course(title="Test Course")
-            mock_chunks = [CourseChunk(content="Chunk 1", course_title="Test Course", chunk_index=0)]
-            rag.document_processor.process_course_document.return_value = (mock_course, mock_chunks)
-
-            return rag
-
-    def test_add_course_folder_success(self, mock_rag_for_folder, tmp_path):
+    @pytest.fixture
+    def course_folder(self):
+        """Fake a folder holding one course file without touching the filesystem"""
+        with patch.object(rs.os.path, 'exists', return_value=True), \
+             patch.object(rs.os, 'listdir', return_value=["course.txt"]), \
+             patch.object(rs.os.path, 'isfile', return_value=True):
+            yield "/fake/courses"
+
+    def test_add_course_folder_success(self, mock_rag_for_folder, course_folder):
         """Test successful folder processing"""
-        # Create test file
-        (tmp_path / "course.txt").write_text("Course Title: Test")
-
-        courses, chunks = mock_rag_for_folder.add_course_folder(str(tmp_path))
+        courses, chunks = mock_rag_for_folder.add_course_folder(course_folder)
 
         assert courses == 1
         assert chunks == 1
 
-    def test_add_course_folder_skips_existing(self, mock_rag_for_folder, tmp_path):
+    def test_add_course_folder_skips_existing(self, mock_rag_for_folder, course_folder):
         """Test that existing courses are skipped"""
-        (tmp_path / "course.txt").write_text("Course Title: Test")
         mock_rag_for_folder.vector_store.get_existing_course_titles.return_value = ["Test Course"]
 
-        courses, chunks = mock_rag_for_folder.add_course_folder(str(tmp_path))
+        courses, chunks = mock_rag_for_folder.add_course_folder(course_folder)
 
         assert courses == 0
         assert chunks == 0
@@ -183,11 +220,9 @@ class TestRAGSystemAddCourseFolder:
         assert courses == 0
         assert chunks == 0
 
-    def test_add_course_folder_clear_existing(self, mock_rag_for_folder, tmp_path):
+    def test_add_course_folder_clear_existing(self, mock_rag_for_folder, course_folder):
         """Test clear_existing option"""
-        (tmp_path / "course.txt").write_text("Course Title: Test")
-
-        mock_rag_for_folder.add_course_folder(str(tmp_path), clear_existing=True)
+        mock_rag_for_folder.add_course_folder(course_folder, clear_existing=True)
 
         mock_rag_for_folder.vector_store.clear_all_data.assert_called_once()
 
@@ -195,22 +230,19 @@ class TestRAGSystemAddCourseFolder:
 class TestRAGSystemGetCourseAnalytics:
     """Tests for RAGSystem.get_course_analytics method"""
 
-    def test_get_course_analytics(self, test_config):
-        """Test course analytics retrieval"""
-        with patch('rag_system.DocumentProcessor'), \
-             patch('rag_system.VectorStore') as MockVS, \
-             patch('rag_system.AIGenerator'), \
-             patch('rag_system.SessionManager'), \
-             patch('rag_system.ToolManager'), \
-             patch('rag_system.CourseSearchTool'):
-
-            from rag_system import RAGSystem
+    @pytest.fixture(scope="class")
+    def analytics_rag(self, _patch_rag_deps, test_config):
+        """Build one RAGSystem for the read-only analytics tests"""
+        # Class setup runs before the per-test rag_deps reset, so clear earlier tests' component mocks here
+        _reset_rag_deps(_patch_rag_deps)
+        return RAGSystem(test_config)
 
-            rag = RAGSystem(test_config)
-            rag.vector_store.get_course_count.return_value = 3
-            rag.vector_store.get_existing_course_titles.return_value = ["Course A", "Course B", "Course C"]
+    def test_get_course_analytics(self, analytics_rag):
+        """Test course analytics retrieval"""
+        analytics_rag.vector_store.get_course_count.return_value = 3
+        analytics_rag.vector_store.get_existing_course_titles.return_value = ["Course A", "Course B", "Course C"]
 
-            analytics = rag.get_course_analytics()
+        analytics = analytics_rag.get_course_analytics()
 
-            assert analytics["total_courses"] == 3
-            assert len(analytics["course_titles"]) == 3
+        assert analytics["total_courses"] == 3
+        assert len(analytics["course_titles"]) == 3
@@ -1,14 +1,32 @@
 """Tests for search_tools module"""
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock
 from search_tools import CourseSearchTool, ToolManager, Tool
 from vector_store import SearchResults
 
+pytestmark = pytest.mark.xdist_group(name="search_tools_tests")
+
+# Fragments _format_results must render for the sample search result
+_EXPECTED_FORMAT_SUBSTRS = ("Test Course", "Lesson 1", "Test content")
+
+
+class _StubTool(Tool):
+    """Minimal Tool implementation for ToolManager tests"""
+
+    def __init__(self):
+        self.last_sources = ["Source 1"]
+
+    def get_tool_definition(self):
+        return {"name": "test_tool", "description": "A test tool"}
+
+    def execute(self, **kwargs):
+        return "Tool executed"
+
 
 class TestCourseSearchToolDefinition:
     """Tests for CourseSearchTool.get_tool_definition"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def search_tool(self):
         """Create CourseSearchTool with mocked vector store"""
         mock_store = Mock()
@@ -52,51 +70,25 @@ class TestCourseSearchToolExecute:
         mock_store.search.return_value = mock_empty_search_results
         return CourseSearchTool(mock_store)
 
-    def test_execute_basic_search(self, search_tool_with_results):
-        """Test basic search execution"""
-        result = search_tool_with_results.execute(query="Python basics")
+    @pytest.mark.parametrize("kwargs", [
+        pytest.param(dict(query="Python basics"), id="basic_search"),
+        pytest.param(dict(query="test", course_name="Python Course"), id="course_filter"),
+        pytest.param(dict(query="test", lesson_number=1), id="lesson_filter"),
+        pytest.param(dict(query="test", course_name="Python Course", lesson_number=2), id="all_filters"),
+    ])
+    def test_execute_filters(self, search_tool_with_results, kwargs):
+        """Test search execution passes query and filters to the store"""
+        search = search_tool_with_results.store.search
+        result = search_tool_with_results.execute(**kwargs)
 
         assert isinstance(result, str)
         assert len(result) > 0
-        search_tool_with_results.store.search.assert_called_once_with(
-            query="Python basics",
-            course_name=None,
-            lesson_number=None
-        )
-
-    def test_execute_with_course_filter(self, search_tool_with_results):
-        """Test search with course name filter"""
-        search_tool_with_results.execute(query="test", course_name="Python Course")
-
-        search_tool_with_results.store.search.assert_called_with(
-            query="test",
-            course_name="Python Course",
-            lesson_number=None
-        )
-
-    def test_execute_with_lesson_filter(self, search_tool_with_results):
-        """Test search with lesson number filter"""
-        search_tool_with_results.execute(query="test", lesson_number=1)
-
-        search_tool_with_results.store.search.assert_called_with(
-            query="test",
-            course_name=None,
-            lesson_number=1
-        )
-
-    def test_execute_with_all_filters(self, search_tool_with_results):
-        """Test search with all filters"""
-        search_tool_with_results.execute(
-            query="test",
-            course_name="Python Course",
-            lesson_number=2
-        )
-
-        search_tool_with_results.store.search.assert_called_with(
-            query="test",
-            course_name="Python Course",
-            lesson_number=2
-        )
+        assert search.call_count == 1
+        assert search.call_args.kwargs == {
+            "query": kwargs["query"],
+            "course_name": kwargs.get("course_name"),
+            "lesson_number": kwargs.get("lesson_number"),
+        }
 
     def test_execute_no_results(self, search_tool_empty_results):
         """Test handling of no results"""
@@ -132,9 +124,8 @@ class TestFormatResults:
 
         formatted = tool._format_results(mock_search_results)
 
-        assert "Test Course" in formatted
-        assert "Lesson 1" in formatted
-        assert "Test content" in formatted
+        missing = [s for s in _EXPECTED_FORMAT_SUBSTRS if s not in formatted]
+        assert not missing
 
     def test_format_results_tracks_sources(self, mock_search_results):
         """Test that formatting tracks sources"""
@@ -156,15 +147,8 @@ class TestToolManager:
 
     @pytest.fixture
     def mock_tool(self):
-        """Create mock tool"""
-        tool = Mock(spec=Tool)
-        tool.get_tool_definition.return_value = {
-            "name": "test_tool",
-            "description": "A test tool"
-        }
-        tool.execute.return_value = "Tool executed"
-        tool.last_sources = ["Source 1"]
-        return tool
+        """Create stub tool"""
+        return _StubTool()
 
     def test_register_tool(self, tool_manager, mock_tool):
         """Test registering a tool"""
@@ -191,6 +175,7 @@ class TestToolManager:
 
     def test_execute_tool(self, tool_manager, mock_tool):
         """Test executing a registered tool"""
+        mock_tool.execute = Mock(wraps=mock_tool.execute)
         tool_manager.register_tool(mock_tool)
 
         result = tool_manager.execute_tool("test_tool", param="value")
@@ -2,25 +2,32 @@
 import pytest
 from session_manager import SessionManager, Message
 
+pytestmark = pytest.mark.xdist_group(name="session_tests")
+
+_M_USER_HELLO = Message(role="user", content="Hello")
+
+
+@pytest.fixture
+def sm():
+    """Create a SessionManager with default history settings"""
+    return SessionManager()
+
 
 class TestSessionCreation:
     """Tests for SessionManager.create_session"""
 
-    def test_create_session_returns_id(self):
+    def test_create_session_returns_id(self, sm):
         """Test that create_session returns a session ID"""
-        manager = SessionManager()
-        session_id = manager.create_session()
+        session_id = sm.create_session()
 
         assert session_id is not None
         assert session_id.startswith("session_")
 
-    def test_create_multiple_sessions(self):
+    def test_create_multiple_sessions(self, sm):
         """Test creating multiple unique sessions"""
-        manager = SessionManager()
-
-        session1 = manager.create_session()
-        session2 = manager.create_session()
-        session3 = manager.create_session()
+        session1 = sm.create_session()
+        session2 = sm.create_session()
+        session3 = sm.create_session()
 
         assert session1 != session2
         assert session2 != session3
@@ -28,65 +35,66 @@ class TestSessionCreation:
         assert session2 == "session_2"
         assert session3 == "session_3"
 
-    def test_create_session_initializes_empty_history(self):
+    def test_create_session_initializes_empty_history(self, sm):
         """Test that new session has empty history"""
-        manager = SessionManager()
-        session_id = manager.create_session()
+        session_id = sm.create_session()
 
-        assert session_id in manager.sessions
-        assert manager.sessions[session_id] == []
+        assert session_id in sm.sessions
+        assert sm.sessions[session_id] == []
 
 
 class TestAddMessage:
     """Tests for SessionManager.add_message"""
 
-    def test_add_message_to_session(self):
+    def test_add_message_to_session(self, sm):
         """Test adding message to existing session"""
-        manager = SessionManager()
-        session_id = manager.create_session()
+        session_id = sm.create_session()
 
-        manager.add_message(session_id, "user", "Hello")
+        sm.add_message(session_id, "user", "Hello")
 
-        assert len(manager.sessions[session_id]) == 1
-        assert manager.sessions[session_id][0].role == "user"
-        assert manager.sessions[session_id][0].content == "Hello"
+        messages = sm.sessions[session_id]
+        assert len(messages) == 1
+        assert messages[0].role == "user"
+        assert messages[0].content == "Hello"
 
-    def test_add_message_creates_session(self):
+    def test_add_message_creates_session(self, sm):
         """Test that add_message creates session if not exists"""
-        manager = SessionManager()
+        sm.add_message("new_session", "user", "Hello")
 
-        manager.add_message("new_session", "user", "Hello")
+        assert "new_session" in sm.sessions
+        assert len(sm.sessions["new_session"]) == 1
 
-        assert "new_session" in manager.sessions
-        assert len(manager.sessions["new_session"]) == 1
-
-    def test_add_multiple_messages(self):
+    def test_add_multiple_messages(self, sm):
         """Test adding multiple messages"""
-        manager = SessionManager()
-        session_id = manager.create_session()
+        session_id = sm.create_session()
 
-        manager.add_message(session_id, "user", "Question 1")
-        manager.add_message(session_id, "assistant", "Answer 1")
-        manager.add_message(session_id, "user", "Question 2")
+        sm.add_message(session_id, "user", "Question 1")
+        sm.add_message(session_id, "assistant", "Answer 1")
+        sm.add_message(session_id, "user", "Question 2")
 
-        assert len(manager.sessions[session_id]) == 3
+        assert len(sm.sessions[session_id]) == 3
 
 
 class TestHistoryLimit:
     """Tests for conversation history limits"""
 
-    def test_history_limit_enforced(self):
+    @pytest.mark.parametrize("max_history,total", [(1, 4), (2, 6), (5, 12)])
+    def test_history_limit_enforced(self, max_history, total):
         """Test that history limit is enforced"""
-        manager = SessionManager(max_history=2)  # 2 exchanges = 4 messages
+        manager = SessionManager(max_history=max_history)
         session_id = manager.create_session()
 
-        # Add 6 messages (3 exchanges)
-        for i in range(6):
-            role = "user" if i % 2 == 0 else "assistant"
-            manager.add_message(session_id, role, f"Message {i}")
+        # Seed all but the last message directly, then let add_message trim
+        manager.sessions[session_id] = [
+            Message("user" if i % 2 == 0 else "assistant", f"Message {i}")
+            for i in range(total - 1)
+        ]
+        manager.add_message(session_id, "assistant", f"Message {total - 1}")
 
-        # Should only keep last 4 messages (2 * max_history)
-        assert len(manager.sessions[session_id]) == 4
+        # Should only keep the last 2 * max_history messages
+        messages = manager.sessions[session_id]
+        assert len(messages) == 2 * max_history
+        assert messages[-1].content == f"Message {total - 1}"
 
     def test_history_keeps_recent_messages(self):
         """Test that recent messages are kept"""
@@ -104,17 +112,32 @@ class TestHistoryLimit:
         assert messages[1].content == "New response"
 
 
+@pytest.mark.perf
+class TestHistoryTrimPerf:
+    """Micro-benchmarks for the history trim path"""
+
+    def test_add_message_trim_perf(self, benchmark):
+        """Benchmark an add_message call that trims a full history"""
+        manager = SessionManager(max_history=5)
+        session_id = manager.create_session()
+        for i in range(10):
+            manager.add_message(session_id, "user", f"Message {i}")
+
+        benchmark(manager.add_message, session_id, "assistant", "New message")
+
+        assert len(manager.sessions[session_id]) == 10
+
+
 class TestAddExchange:
     """Tests for SessionManager.add_exchange"""
 
-    def test_add_exchange(self):
+    def test_add_exchange(self, sm):
         """Test adding a complete exchange"""
-        manager = SessionManager()
-        session_id = manager.create_session()
+        session_id = sm.create_session()
 
-        manager.add_exchange(session_id, "What is Python?", "Python is a programming language.")
+        sm.add_exchange(session_id, "What is Python?", "Python is a programming language.")
 
-        messages = manager.sessions[session_id]
+        messages = sm.sessions[session_id]
         assert len(messages) == 2
         assert messages[0].role == "user"
         assert messages[0].content == "What is Python?"
@@ -125,41 +148,35 @@ class TestAddExchange:
 class TestGetConversationHistory:
     """Tests for SessionManager.get_conversation_history"""
 
-    def test_get_history_returns_formatted_string(self):
+    def test_get_history_returns_formatted_string(self, sm):
         """Test that history is returned as formatted string"""
-        manager = SessionManager()
-        session_id = manager.create_session()
+        session_id = sm.create_session()
 
-        manager.add_message(session_id, "user", "Hello")
-        manager.add_message(session_id, "assistant", "Hi there!")
+        sm.add_message(session_id, "user", "Hello")
+        sm.add_message(session_id, "assistant", "Hi there!")
 
-        history = manager.get_conversation_history(session_id)
+        history = sm.get_conversation_history(session_id)
 
         assert "User: Hello" in history
         assert "Assistant: Hi there!" in history
 
-    def test_get_history_empty_session(self):
+    def test_get_history_empty_session(self, sm):
         """Test getting history from empty session"""
-        manager = SessionManager()
-        session_id = manager.create_session()
+        session_id = sm.create_session()
 
-        history = manager.get_conversation_history(session_id)
+        history = sm.get_conversation_history(session_id)
 
         assert history is None
 
-    def test_get_history_invalid_session(self):
+    def test_get_history_invalid_session(self, sm):
         """Test getting history from non-existent session"""
-        manager = SessionManager()
-
-        history = manager.get_conversation_history("invalid_session")
+        history = sm.get_conversation_history("invalid_session")
 
         assert history is None
 
-    def test_get_history_none_session_id(self):
+    def test_get_history_none_session_id(self, sm):
         """Test getting history with None session ID"""
-        manager = SessionManager()
-
-        history = manager.get_conversation_history(None)
+        history = sm.get_conversation_history(None)
 
         assert history is None
 
@@ -167,22 +184,19 @@ class TestGetConversationHistory:
 class TestClearSession:
     """Tests for SessionManager.clear_session"""
 
-    def test_clear_session(self):
+    def test_clear_session(self, sm):
         """Test clearing a session"""
-        manager = SessionManager()
-        session_id = manager.create_session()
+        session_id = sm.create_session()
 
-        manager.add_message(session_id, "user", "Hello")
-        manager.clear_session(session_id)
+        sm.add_message(session_id, "user", "Hello")
+        sm.clear_session(session_id)
 
-        assert manager.sessions[session_id] == []
+        assert sm.sessions[session_id] == []
 
-    def test_clear_nonexistent_session(self):
+    def test_clear_nonexistent_session(self, sm):
         """Test clearing a non-existent session doesn't raise error"""
-        manager = SessionManager()
-
         # Should not raise an error
-        manager.clear_session("nonexistent")
+        sm.clear_session("nonexistent")
 
 
 class TestMessageDataclass:
@@ -190,14 +204,9 @@ class TestMessageDataclass:
 
     def test_message_creation(self):
         """Test creating a Message"""
-        msg = Message(role="user", content="Hello")
-
-        assert msg.role == "user"
-        assert msg.content == "Hello"
+        assert _M_USER_HELLO.role == "user"
+        assert _M_USER_HELLO.content == "Hello"
 
     def test_message_equality(self):
         """Test Message equality"""
-        msg1 = Message(role="user", content="Hello")
-        msg2 = Message(role="user", content="Hello")
-
-        assert msg1 == msg2
+        assert Message(role="user", content="Hello") == _M_USER_HELLO
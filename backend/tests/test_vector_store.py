@@ -1,45 +1,80 @@
 """Tests for VectorStore module"""
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from contextlib import ExitStack
+from types import MappingProxyType
+from unittest.mock import patch
+import vector_store as vs
 from vector_store import VectorStore, SearchResults
+from models import Course, Lesson, CourseChunk
 
+# Read-only ChromaDB query payloads shared by the tests
+_CHROMA_HIT = MappingProxyType({
+    'documents': [['Doc 1', 'Doc 2']],
+    'metadatas': [[{'course': 'A'}, {'course': 'B'}]],
+    'distances': [[0.1, 0.2]]
+})
+_CHROMA_EMPTY = MappingProxyType({'documents': [[]], 'metadatas': [[]], 'distances': [[]]})
+_CHROMA_COURSE_MATCH = MappingProxyType({
+    'documents': [['Test Course']],
+    'metadatas': [[{'title': 'Test Course'}]],
+    'distances': [[0.1]]
+})
 
-class TestSearchResults:
-    """Tests for SearchResults dataclass"""
 
-    def test_from_chroma_with_results(self):
-        """Test creating SearchResults from ChromaDB results"""
-        chroma_results = {
-            'documents': [['Doc 1', 'Doc 2']],
-            'metadatas': [[{'course': 'A'}, {'course': 'B'}]],
-            'distances': [[0.1, 0.2]]
-        }
+@pytest.fixture(scope="module", autouse=True)
+def _patch_chroma(_session_chroma_client):
+    """Point ChromaDB's client and embedding function at mocks once for the whole module"""
+    with ExitStack() as stack:
+        stack.enter_context(patch.object(vs.chromadb, 'PersistentClient', return_value=_session_chroma_client))
+        stack.enter_context(patch.object(vs.chromadb.utils.embedding_functions, 'SentenceTransformerEmbeddingFunction'))
+        yield
 
-        results = SearchResults.from_chroma(chroma_results)
 
-        assert results.documents == ['Doc 1', 'Doc 2']
-        assert results.metadata == [{'course': 'A'}, {'course': 'B'}]
-        assert results.distances == [0.1, 0.2]
-        assert results.error is None
+@pytest.fixture(scope="module")
+def _module_store():
+    """Build one VectorStore over the session ChromaDB mocks for the whole module"""
+    return VectorStore("./test_db", "all-MiniLM-L6-v2", max_results=5)
+
 
-    def test_from_chroma_empty(self):
-        """Test creating SearchResults from empty ChromaDB results"""
-        chroma_results = {
-            'documents': [[]],
-            'metadatas': [[]],
-            'distances': [[]]
-        }
+@pytest.fixture
+def mock_store(_module_store, mock_chroma_client):
+    """Shared VectorStore with the ChromaDB mocks' payloads and call history reset"""
+    return _module_store
 
+
+class TestSearchResults:
+    """Tests for SearchResults dataclass"""
+
+    @pytest.mark.parametrize("chroma_results,expected_docs,expected_metadata,expected_distances", [
+        pytest.param(
+            _CHROMA_HIT,
+            ['Doc 1', 'Doc 2'], [{'course': 'A'}, {'course': 'B'}], [0.1, 0.2],
+            id="with_results",
+        ),
+        pytest.param(
+            _CHROMA_EMPTY,
+            [], [], [],
+            id="empty",
+        ),
+    ])
+    def test_from_chroma(self, chroma_results, expected_docs, expected_metadata, expected_distances):
+        """Test creating SearchResults from ChromaDB results"""
         results = SearchResults.from_chroma(chroma_results)
 
-        assert results.documents == []
-        assert results.is_empty()
+        docs, metadata, distances = results.documents, results.metadata, results.distances
+        assert len(docs) == len(metadata) == len(distances) == len(expected_docs)
+        for i, doc in enumerate(expected_docs):
+            assert docs[i] == doc
+            assert metadata[i]["course"] == expected_metadata[i]["course"]
+            assert distances[i] == expected_distances[i]
+        assert results.error is None
+        assert results.is_empty() == (not expected_docs)
 
     def test_empty_with_error(self):
         """Test creating empty SearchResults with error"""
         results = SearchResults.empty("No course found")
 
-        assert results.documents == []
+        assert not results.documents
         assert results.error == "No course found"
         assert results.is_empty()
 
@@ -51,33 +86,31 @@ class TestSearchResults:
         assert empty.is_empty()
         assert not not_empty.is_empty()
 
+    def test_searchresults_is_slotted(self):
+        """Test SearchResults uses slots and rejects mutation"""
+        results = SearchResults(documents=[], metadata=[], distances=[])
+
+        assert "__slots__" in vars(SearchResults)
+        assert not hasattr(results, "__dict__")
+        with pytest.raises(AttributeError):
+            results.error = "changed"
+
 
 class TestVectorStoreInitialization:
     """Tests for VectorStore initialization"""
 
     def test_initialization(self, mock_chroma_client):
         """Test VectorStore initializes collections"""
-        with patch('vector_store.chromadb.PersistentClient', return_value=mock_chroma_client), \
-             patch('vector_store.chromadb.utils.embedding_functions.SentenceTransformerEmbeddingFunction'):
+        store = VectorStore("./test_db", "all-MiniLM-L6-v2", max_results=5)
 
-            store = VectorStore("./test_db", "all-MiniLM-L6-v2", max_results=5)
-
-            assert store.max_results == 5
-            assert mock_chroma_client.get_or_create_collection.call_count == 2
+        assert store.max_results == 5
+        assert mock_chroma_client.get_or_create_collection.call_count == 2
 
 
+@pytest.mark.no_trace
 class TestVectorStoreSearch:
     """Tests for VectorStore.search method"""
 
-    @pytest.fixture
-    def mock_store(self, mock_chroma_client, mock_chroma_collection):
-        """Create VectorStore with mocked dependencies"""
-        with patch('vector_store.chromadb.PersistentClient', return_value=mock_chroma_client), \
-             patch('vector_store.chromadb.utils.embedding_functions.SentenceTransformerEmbeddingFunction'):
-
-            store = VectorStore("./test_db", "all-MiniLM-L6-v2", max_results=5)
-            return store
-
     def test_search_no_filters(self, mock_store):
         """Test search without any filters"""
         results = mock_store.search(query="Python basics")
@@ -88,11 +121,7 @@ class TestVectorStoreSearch:
     def test_search_with_course_name(self, mock_store):
         """Test search with course name filter"""
         # Configure mock to resolve course name
-        mock_store.course_catalog.query.return_value = {
-            'documents': [['Test Course']],
-            'metadatas': [[{'title': 'Test Course'}]],
-            'distances': [[0.1]]
-        }
+        mock_store.course_catalog.query.return_value = _CHROMA_COURSE_MATCH
 
         results = mock_store.search(query="test", course_name="Test")
 
@@ -101,92 +130,68 @@ class TestVectorStoreSearch:
 
     def test_search_course_not_found(self, mock_store):
         """Test search when course is not found"""
-        mock_store.course_catalog.query.return_value = {
-            'documents': [[]],
-            'metadatas': [[]],
-            'distances': [[]]
-        }
+        mock_store.course_catalog.query.return_value = _CHROMA_EMPTY
 
         results = mock_store.search(query="test", course_name="NonExistent")
 
         assert results.error is not None
         assert "No course found" in results.error
 
+    def test_search_handles_query_error(self, mock_store):
+        """Test search turns a ChromaDB query failure into an error result"""
+        mock_store.course_content.query.side_effect = Exception("Connection lost")
+
+        results = mock_store.search(query="test")
+
+        assert results.error == "Search error: Connection lost"
+        assert results.is_empty()
+
     def test_search_with_lesson_filter(self, mock_store):
         """Test search with lesson number filter"""
         results = mock_store.search(query="test", lesson_number=1)
 
-        call_args = mock_store.course_content.query.call_args
-        assert call_args.kwargs["where"] == {"lesson_number": 1}
+        kwargs = mock_store.course_content.query.call_args.kwargs
+        assert kwargs["where"] == {"lesson_number": 1}
 
     def test_search_with_limit(self, mock_store):
         """Test search respects limit parameter"""
         mock_store.search(query="test", limit=3)
 
-        call_args = mock_store.course_content.query.call_args
-        assert call_args.kwargs["n_results"] == 3
+        kwargs = mock_store.course_content.query.call_args.kwargs
+        assert kwargs["n_results"] == 3
 
     def test_search_uses_default_limit(self, mock_store):
         """Test search uses default max_results"""
         mock_store.search(query="test")
 
-        call_args = mock_store.course_content.query.call_args
-        assert call_args.kwargs["n_results"] == 5
+        kwargs = mock_store.course_content.query.call_args.kwargs
+        assert kwargs["n_results"] == 5
 
 
+@pytest.mark.no_trace
 class TestBuildFilter:
     """Tests for VectorStore._build_filter method"""
 
-    @pytest.fixture
-    def mock_store(self, mock_chroma_client):
-        """Create VectorStore for filter tests"""
-        with patch('vector_store.chromadb.PersistentClient', return_value=mock_chroma_client), \
-             patch('vector_store.chromadb.utils.embedding_functions.SentenceTransformerEmbeddingFunction'):
-
-            return VectorStore("./test_db", "all-MiniLM-L6-v2")
-
-    def test_build_filter_no_params(self, mock_store):
-        """Test filter with no parameters"""
-        result = mock_store._build_filter(None, None)
-        assert result is None
-
-    def test_build_filter_course_only(self, mock_store):
-        """Test filter with course title only"""
-        result = mock_store._build_filter("Test Course", None)
-        assert result == {"course_title": "Test Course"}
-
-    def test_build_filter_lesson_only(self, mock_store):
-        """Test filter with lesson number only"""
-        result = mock_store._build_filter(None, 1)
-        assert result == {"lesson_number": 1}
-
-    def test_build_filter_both(self, mock_store):
-        """Test filter with both course and lesson"""
-        result = mock_store._build_filter("Test Course", 2)
-
-        assert result == {
-            "$and": [
-                {"course_title": "Test Course"},
-                {"lesson_number": 2}
-            ]
-        }
+    @pytest.mark.parametrize("course_title,lesson_number,expected", [
+        pytest.param(None, None, None, id="no_params"),
+        pytest.param("Test Course", None, {"course_title": "Test Course"}, id="course_only"),
+        pytest.param(None, 1, {"lesson_number": 1}, id="lesson_only"),
+        pytest.param(
+            "Test Course", 2,
+            {"$and": [{"course_title": "Test Course"}, {"lesson_number": 2}]},
+            id="both",
+        ),
+    ])
+    def test_build_filter(self, mock_store, course_title, lesson_number, expected):
+        """Test filter construction for each combination of course and lesson"""
+        assert mock_store._build_filter(course_title, lesson_number) == expected
 
 
 class TestVectorStoreAddMethods:
     """Tests for VectorStore add methods"""
 
-    @pytest.fixture
-    def mock_store(self, mock_chroma_client):
-        """Create VectorStore for add tests"""
-        with patch('vector_store.chromadb.PersistentClient', return_value=mock_chroma_client), \
-             patch('vector_store.chromadb.utils.embedding_functions.SentenceTransformerEmbeddingFunction'):
-
-            return VectorStore("./test_db", "all-MiniLM-L6-v2")
-
     def test_add_course_metadata(self, mock_store):
         """Test adding course metadata"""
-        from models import Course, Lesson
-
         course = Course(
             title="Test Course",
             course_link="https://example.com",
@@ -197,13 +202,11 @@ class TestVectorStoreAddMethods:
         mock_store.add_course_metadata(course)
 
         mock_store.course_catalog.add.assert_called_once()
-        call_args = mock_store.course_catalog.add.call_args
-        assert call_args.kwargs["ids"] == ["Test Course"]
+        kwargs = mock_store.course_catalog.add.call_args.kwargs
+        assert kwargs["ids"] == ["Test Course"]
 
     def test_add_course_content(self, mock_store):
         """Test adding course content chunks"""
-        from models import CourseChunk
-
         chunks = [
             CourseChunk(content="Chunk 1", course_title="Test", lesson_number=1, chunk_index=0),
             CourseChunk(content="Chunk 2", course_title="Test", lesson_number=1, chunk_index=1)
@@ -212,8 +215,23 @@ class TestVectorStoreAddMethods:
         mock_store.add_course_content(chunks)
 
         mock_store.course_content.add.assert_called_once()
-        call_args = mock_store.course_content.add.call_args
-        assert len(call_args.kwargs["documents"]) == 2
+        kwargs = mock_store.course_content.add.call_args.kwargs
+        assert len(kwargs["documents"]) == 2
+
+    @pytest.mark.parametrize("chunk_count", [1, 100, 5000])
+    def test_add_course_content_scales(self, mock_store, chunk_count):
+        """Test every chunk's content and ID reach the collection for larger batches"""
+        contents = [f"Chunk {i}" for i in range(chunk_count)]
+        chunks = [
+            CourseChunk(content=content, course_title="Test", lesson_number=1, chunk_index=i)
+            for i, content in enumerate(contents)
+        ]
+
+        mock_store.add_course_content(chunks)
+
+        kwargs = mock_store.course_content.add.call_args.kwargs
+        assert kwargs["documents"] == contents
+        assert kwargs["ids"] == [f"Test_{i}" for i in range(chunk_count)]
 
     def test_add_course_content_empty(self, mock_store):
         """Test adding empty chunks list"""
@@ -225,34 +243,14 @@ class TestVectorStoreAddMethods:
 class TestVectorStoreClearAndGet:
     """Tests for VectorStore clear and get methods"""
 
-    @pytest.fixture
-    def mock_store(self, mock_chroma_client):
-        """Create VectorStore for clear/get tests"""
-        with patch('vector_store.chromadb.PersistentClient', return_value=mock_chroma_client), \
-             patch('vector_store.chromadb.utils.embedding_functions.SentenceTransformerEmbeddingFunction'):
-
-            return VectorStore("./test_db", "all-MiniLM-L6-v2")
-
     def test_clear_all_data(self, mock_store):
         """Test clearing all data"""
         mock_store.clear_all_data()
 
         assert mock_store.client.delete_collection.call_count == 2
 
-    def test_get_existing_course_titles(self, mock_store):
-        """Test getting existing course titles"""
-        titles = mock_store.get_existing_course_titles()
-
-        assert titles == ['Test Course']
-
-    def test_get_course_count(self, mock_store):
-        """Test getting course count"""
-        count = mock_store.get_course_count()
-
-        assert count == 1
-
-    def test_get_course_link(self, mock_store):
-        """Test getting course link"""
-        link = mock_store.get_course_link("Test Course")
-
-        assert link == "https://example.com"
+    def test_get_methods(self, mock_store):
+        """Test the catalog getters read titles, count and link from the same catalog state"""
+        assert mock_store.get_existing_course_titles() == ['Test Course']
+        assert mock_store.get_course_count() == 1
+        assert mock_store.get_course_link("Test Course") == "https://example.com"